@@ -1,113 +1,148 @@
+import re
+import sys
 from collections import UserDict
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from functools import lru_cache
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def input_error(func):
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except ValueError as e:
-            return f"Error: {e}"
-        except IndexError:
-            return "Error: Not enough arguments provided."
-        except KeyError:
-            return "Error: Contact not found."
-    return wrapper
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
+@lru_cache(maxsize=4096)
+def _parse_ddmmyyyy(value):
+    if len(value) != 10 or value[2] != "." or value[5] != ".":
+        raise ValueError(f"time data {value!r} does not match format DD.MM.YYYY")
+    return date(int(value[6:10]), int(value[3:5]), int(value[0:2]))
 
-class Field:
-    def __init__(self, value):
-        self.value = value
 
+# Рівно 10 ASCII-цифр; скомпільовано один раз на рівні модуля
+_PHONE_RE = re.compile(r"[0-9]{10}\Z").match
 
+# Зсув дня привітання з вихідних на понеділок, індексований weekday()
+_WEEKEND_SHIFT = (0, 0, 0, 0, 0, 2, 1)
 
-class Name(Field):
-    pass
+# Кількість днів до початку кожного місяця (без урахування високосного року)
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
 
+# Мінімальний розмір книги, з якого векторизований прохід окупається
+_NUMPY_MIN_RECORDS = 500
 
 
-class Phone(Field):
-    def __init__(self, value):
-        if not self.validate_phone(value):
-            raise ValueError("Phone number must contain exactly 10 digits.")
-        super().__init__(value)
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
-    @staticmethod
-    def validate_phone(phone):
-        return phone.isdigit() and len(phone) == 10
 
+if np is not None:
+    _DAYS_BEFORE_MONTH_ARR = np.array(_DAYS_BEFORE_MONTH, dtype=np.int64)
+    _WEEKEND_SHIFT_ARR = np.array(_WEEKEND_SHIFT, dtype=np.int64)
 
 
-class Birthday(Field):
-    def __init__(self, value):
-        if not self.validate_birthday(value):
-            raise ValueError("Birthday must be in DD.MM.YYYY format.")
-        super().__init__(value)
+def _scan_birthdays(months, days, year_start, today_ord, leap):
+    # Повертає зсунуті ординали для записів у вікні 0..7 днів, інакше 0
+    shifted = np.zeros(len(months), dtype=np.int64)
+    for i in range(len(months)):
+        ordinal = year_start + _DAYS_BEFORE_MONTH_ARR[months[i] - 1] + days[i] - 1
+        if leap and months[i] > 2:
+            ordinal += 1
+        delta = ordinal - today_ord
+        if 0 <= delta <= 7:
+            shifted[i] = ordinal + _WEEKEND_SHIFT_ARR[(ordinal - 1) % 7]
+    return shifted
 
-    @staticmethod
-    def validate_birthday(birthday):
-        try:
-            datetime.strptime(birthday, "%d.%m.%Y")
-            return True
-        except ValueError:
-            return False
+
+if njit is not None and np is not None:
+    _scan_birthdays = njit(cache=True)(_scan_birthdays)
+
+
+def _validate_phone(phone):
+    if _PHONE_RE(phone) is None:
+        raise ValueError("Phone number must contain exactly 10 digits.")
+    return phone
+
+
+def _validate_birthday(birthday):
+    try:
+        return _parse_ddmmyyyy(birthday)
+    except ValueError:
+        raise ValueError("Birthday must be in DD.MM.YYYY format.") from None
 
 
 
 class Record:
+    __slots__ = ("name", "phones", "birthday", "_book")
+
     def __init__(self, name):
-        self.name = Name(name)
-        self.phones = []
+        # Інтернуємо ім'я: той самий рядок є ключем книги й полем запису
+        self.name = sys.intern(name)
+        self.phones = {}
         self.birthday = None
+        self._book = None
 
     def add_phone(self, phone):
-        self.phones.append(Phone(phone))
+        self.phones[_validate_phone(phone)] = None
 
     def remove_phone(self, phone):
-        phone_obj = self.find_phone(phone)
-        if phone_obj:
-            self.phones.remove(phone_obj)
-        else:
+        if phone not in self.phones:
             raise ValueError("Phone number not found.")
+        del self.phones[phone]
 
     def edit_phone(self, old_phone, new_phone):
-        phone_obj = self.find_phone(old_phone)
-        if phone_obj:
-            self.phones[self.phones.index(phone_obj)] = Phone(new_phone)
-        else:
+        if old_phone not in self.phones:
             raise ValueError("Old phone number not found.")
+        _validate_phone(new_phone)
+        del self.phones[old_phone]
+        self.phones[new_phone] = None
 
     def find_phone(self, phone):
-        for phone_obj in self.phones:
-            if phone_obj.value == phone:
-                return phone_obj
-        return None
+        return phone if phone in self.phones else None
 
     def add_birthday(self, birthday):
-        self.birthday = Birthday(birthday)
+        self.birthday = _validate_birthday(birthday)
+        if self._book is not None:
+            self._book._with_birthday[self.name] = self
 
     def days_to_birthday(self):
         if not self.birthday:
             return None
         today = datetime.today().date()
-        bday_this_year = datetime.strptime(self.birthday.value, "%d.%m.%Y").date().replace(year=today.year)
-        
-        if bday_this_year < today:
+        today_ord = today.toordinal()
+        bday_this_year = self.birthday.replace(year=today.year)
+
+        if bday_this_year.toordinal() < today_ord:
             bday_this_year = bday_this_year.replace(year=today.year + 1)
-        
-        return (bday_this_year - today).days
+
+        return bday_this_year.toordinal() - today_ord
 
     def __str__(self):
-        phones_str = ", ".join(phone.value for phone in self.phones)
-        birthday_str = f", Birthday: {self.birthday.value}" if self.birthday else ""
-        return f"{self.name.value}: {phones_str if phones_str else 'No phones'}{birthday_str}"
+        phones_str = ", ".join(self.phones) if self.phones else "No phones"
+        if self.birthday:
+            b = self.birthday
+            birthday_str = f", Birthday: {b.day:02d}.{b.month:02d}.{b.year}"
+        else:
+            birthday_str = ""
+        return f"{self.name}: {phones_str}{birthday_str}"
 
 
 
 class AddressBook(UserDict):
+    def __init__(self):
+        super().__init__()
+        # Індекс записів, що мають день народження
+        self._with_birthday = {}
+
     def add_record(self, record):
-        self.data[record.name.value] = record
+        # Ключ — той самий інтернований об'єкт, що й record.name
+        self.data[record.name] = record
+        record._book = self
+        if record.birthday:
+            self._with_birthday[record.name] = record
 
     def find(self, name):
         return self.data.get(name)
@@ -115,31 +150,87 @@ class AddressBook(UserDict):
     def delete(self, name):
         if name in self.data:
             del self.data[name]
+            self._with_birthday.pop(name, None)
         else:
             raise ValueError("Name not found in address book.")
 
     def get_upcoming_birthdays(self):
-        upcoming_birthdays = []
         today = datetime.today().date()
-        seven_days_later = today + timedelta(days=7)
-        
-        for record in self.data.values():
-            if record.birthday:
-                bday_this_year = datetime.strptime(record.birthday.value, "%d.%m.%Y").date().replace(year=today.year)
-                
-                if today <= bday_this_year <= seven_days_later:
-                    # Перевіряємо, чи день народження випадає на вихідний
-                    if bday_this_year.weekday() == 5:  # Субота
-                        bday_this_year += timedelta(days=2)  # Переносимо на понеділок
-                    elif bday_this_year.weekday() == 6:  # Неділя
-                        bday_this_year += timedelta(days=1)  # Переносимо на понеділок
-                    
-                    upcoming_birthdays.append({
-                        "name": record.name.value,
-                        "birthday": bday_this_year
-                    })
-
-        return upcoming_birthdays
+
+        if np is not None and len(self._with_birthday) >= _NUMPY_MIN_RECORDS:
+            yield from self._get_upcoming_birthdays_numpy(today)
+            return
+
+        today_ord = today.toordinal()
+
+        for record in self._with_birthday.values():
+            birthday = record.birthday
+            bday_ord = date(today.year, birthday.month, birthday.day).toordinal()
+
+            if 0 <= bday_ord - today_ord <= 7:
+                # Переносимо привітання з вихідних на понеділок;
+                # ординал 1 — понеділок, тож weekday == (ordinal - 1) % 7
+                yield record.name, date.fromordinal(
+                    bday_ord + _WEEKEND_SHIFT[(bday_ord - 1) % 7]
+                )
+
+    def _get_upcoming_birthdays_numpy(self, today):
+        names = list(self._with_birthday)
+        months = np.empty(len(names), dtype=np.intp)
+        days = np.empty(len(names), dtype=np.intp)
+        for i, record in enumerate(self._with_birthday.values()):
+            months[i] = record.birthday.month
+            days[i] = record.birthday.day
+
+        year_start = date(today.year, 1, 1).toordinal()
+
+        if njit is not None:
+            shifted = _scan_birthdays(
+                months, days, year_start, today.toordinal(), _is_leap(today.year)
+            )
+            return [
+                (names[i], date.fromordinal(int(ordinal)))
+                for i, ordinal in enumerate(shifted)
+                if ordinal
+            ]
+
+        # Ординали днів народження цього року, порахованi векторно
+        ordinals = year_start + np.take(_DAYS_BEFORE_MONTH, months - 1) + (days - 1)
+        if _is_leap(today.year):
+            ordinals += months > 2
+
+        delta = ordinals - today.toordinal()
+        mask = (delta >= 0) & (delta <= 7)
+
+        # weekday() == 0 для понеділка; ординал 1 — теж понеділок
+        weekdays = (ordinals - 1) % 7
+        shifted = ordinals + np.take(_WEEKEND_SHIFT, weekdays)
+
+        return [
+            (names[i], date.fromordinal(int(shifted[i])))
+            for i in np.nonzero(mask)[0]
+        ]
+
+    def __getstate__(self):
+        # Серіалізуємо паралельними списками замість графа об'єктів Record
+        return {
+            "names": list(self.data),
+            "phones": [list(record.phones) for record in self.data.values()],
+            "bdays": [
+                record.birthday.toordinal() if record.birthday else None
+                for record in self.data.values()
+            ],
+        }
+
+    def __setstate__(self, state):
+        self.data = {}
+        self._with_birthday = {}
+        for name, phones, bday in zip(state["names"], state["phones"], state["bdays"]):
+            record = Record(name)
+            record.phones = dict.fromkeys(phones)
+            if bday is not None:
+                record.birthday = date.fromordinal(bday)
+            self.add_record(record)
 
     def __str__(self):
         records = "\n".join(str(record) for record in self.data.values())
@@ -147,7 +238,6 @@ class AddressBook(UserDict):
 
 
 
-@input_error
 def handle_add(args, address_book):
     if len(args) == 2:
         name, phone = args
@@ -162,7 +252,6 @@ def handle_add(args, address_book):
     return "Error: 'add' command should have two arguments [name] [phone]"
 
 
-@input_error
 def handle_change(args, address_book):
     if len(args) == 3:
         name, old_phone, new_phone = args
@@ -177,23 +266,20 @@ def handle_change(args, address_book):
     return "Error: 'change' command should have three arguments [name] [old phone] [new phone]"
 
 
-@input_error
 def handle_phone(args, address_book):
     if len(args) == 1:
         name = args[0]
         record = address_book.find(name)
         if record:
-            return f"Phone numbers for {name}: " + ", ".join(phone.value for phone in record.phones)
+            return f"Phone numbers for {name}: " + ", ".join(record.phones)
         return f"Error: Contact '{name}' not found."
     return "Error: 'phone' command should have one argument [name]"
 
 
-@input_error
-def handle_all(address_book):
+def handle_all(args, address_book):
     return str(address_book)
 
 
-@input_error
 def handle_add_birthday(args, address_book):
     if len(args) == 2:
         name, birthday = args
@@ -208,68 +294,109 @@ def handle_add_birthday(args, address_book):
     return "Error: 'add-birthday' command should have two arguments [name] [birthday]"
 
 
-@input_error
 def handle_show_birthday(args, address_book):
     if len(args) == 1:
         name = args[0]
         record = address_book.find(name)
         if record and record.birthday:
-            return f"Birthday for {name} is {record.birthday.value}."
+            b = record.birthday
+            return f"Birthday for {name} is {b.day:02d}.{b.month:02d}.{b.year}."
         return f"Error: Contact '{name}' not found or has no birthday set."
     return "Error: 'show-birthday' command should have one argument [name]"
 
 
-@input_error
-def handle_birthdays(address_book):
-    upcoming_birthdays = address_book.get_upcoming_birthdays()
-    if upcoming_birthdays:
-        return "\n".join(
-            f"{entry['name']}'s birthday celebration is on {entry['birthday'].strftime('%d.%m.%Y')}"
-            for entry in upcoming_birthdays
+def handle_birthdays(args, address_book):
+    lines = "\n".join(
+        f"{name}'s birthday celebration is on {bday.day:02d}.{bday.month:02d}.{bday.year}"
+        for name, bday in address_book.get_upcoming_birthdays()
+    )
+    return lines or "No birthdays in the next 7 days."
+
+
+
+def handle_hello(args, address_book):
+    return "How can I help you?"
+
+
+def handle_exit(args, address_book):
+    return "Good bye!"
+
+
+COMMANDS = {
+    "hello": handle_hello,
+    "add": handle_add,
+    "change": handle_change,
+    "phone": handle_phone,
+    "all": handle_all,
+    "add-birthday": handle_add_birthday,
+    "show-birthday": handle_show_birthday,
+    "birthdays": handle_birthdays,
+    "close": handle_exit,
+    "exit": handle_exit,
+}
+
+# Скільки відповідей накопичувати перед записом у stdout у пакетному режимі
+_FLUSH_EVERY = 64
+
+
+def execute_command(command, args, address_book):
+    handler = COMMANDS.get(command)
+    if handler is None:
+        return "Unknown command. Please try again.", False
+
+    try:
+        return handler(args, address_book), handler is handle_exit
+    except ValueError as e:
+        return f"Error: {e}", False
+    except IndexError:
+        return "Error: Not enough arguments provided.", False
+    except KeyError:
+        return "Error: Contact not found.", False
+
+
+def run_batch(address_book):
+    buffer = []
+    write = sys.stdout.write
+
+    for line in sys.stdin:
+        command_parts = line.split()
+        if not command_parts:
+            continue
+
+        response, should_exit = execute_command(
+            command_parts[0].lower(), command_parts[1:], address_book
         )
-    return "No birthdays in the next 7 days."
+        buffer.append(response + "\n")
+
+        if len(buffer) >= _FLUSH_EVERY:
+            write("".join(buffer))
+            buffer.clear()
+
+        if should_exit:
+            break
 
+    write("".join(buffer))
+    sys.stdout.flush()
 
 
 def main():
     address_book = AddressBook()
 
+    # Пакетний режим для перенаправленого вводу: без запрошень і з буферизацією
+    if not sys.stdin.isatty():
+        run_batch(address_book)
+        return
+
     while True:
         user_input = input("Enter command: ").strip()
         command_parts = user_input.split()
         command = command_parts[0].lower()
         args = command_parts[1:]
 
-        if command == "hello":
-            print("How can I help you?")
-        
-        elif command == "add":
-            print(handle_add(args, address_book))
-
-        elif command == "change":
-            print(handle_change(args, address_book))
-
-        elif command == "phone":
-            print(handle_phone(args, address_book))
-
-        elif command == "all":
-            print(handle_all(address_book))
-
-        elif command == "add-birthday":
-            print(handle_add_birthday(args, address_book))
-
-        elif command == "show-birthday":
-            print(handle_show_birthday(args, address_book))
-
-        elif command == "birthdays":
-            print(handle_birthdays(address_book))
-
-        elif command in ["close", "exit"]:
-            print("Good bye!")
+        response, should_exit = execute_command(command, args, address_book)
+        print(response)
+        if should_exit:
             break
-        
-        else:
-            print("Unknown command. Please try again.")
 
 
 if __name__ == "__main__":